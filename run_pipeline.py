@@ -11,6 +11,13 @@ from ir_codex.pipeline import run_all, run_extract, run_keywords, run_pdf, run_t
 LOGGER_FORMAT = "%(levelname)s: %(message)s"
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"tem de ser pelo menos 1: {value}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Executa o pipeline do Codex de Relações Internacionais.")
     parser.add_argument(
@@ -24,6 +31,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Caminho alternativo para o PDF de origem ao executar a extração.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Número de processos para gerar os PDFs dos capítulos (por omissão, um por CPU).",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -44,9 +57,9 @@ def main() -> None:
     elif args.command == "keywords":
         run_keywords()
     elif args.command == "pdf":
-        run_pdf()
+        run_pdf(jobs=args.jobs)
     elif args.command == "all":
-        run_all()
+        run_all(jobs=args.jobs)
     else:  # pragma: no cover - argparse already restricts choices
         raise ValueError(f"Comando desconhecido: {args.command}")
 
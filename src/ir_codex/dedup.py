@@ -0,0 +1,76 @@
+"""Reuse of translations for repeated paragraphs."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SHINGLE_SIZE = 5
+
+
+class TranslationMemory:
+    """Remember paragraph translations so repeated paragraphs are translated once.
+
+    Paragraphs are matched after lowercasing and stripping punctuation. When
+    ``near_duplicate_threshold`` is set, paragraphs whose character 5-gram
+    Jaccard similarity with an already translated paragraph reaches the
+    threshold reuse its translation too; this requires ``datasketch``.
+    """
+
+    def __init__(self, near_duplicate_threshold: float | None = None, num_perm: int = 128) -> None:
+        self._translations: dict[int, str] = {}
+        self._num_perm = num_perm
+        self._lsh = None
+        if near_duplicate_threshold is not None:
+            from datasketch import MinHashLSH
+
+            self._lsh = MinHashLSH(threshold=near_duplicate_threshold, num_perm=num_perm)
+
+    def key(self, paragraph: str) -> int:
+        """Return the 64-bit SHA-1 prefix identifying a normalised paragraph."""
+        digest = hashlib.sha1(_normalize(paragraph).encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    def get(self, paragraph: str) -> str | None:
+        translation = self._translations.get(self.key(paragraph))
+        if translation is not None or self._lsh is None:
+            return translation
+        minhash = self._minhash(_normalize(paragraph))
+        if minhash is None:
+            return None
+        for match in self._lsh.query(minhash):
+            return self._translations[match]
+        return None
+
+    def add(self, paragraph: str, translation: str) -> None:
+        key = self.key(paragraph)
+        if key in self._translations:
+            return
+        self._translations[key] = translation
+        if self._lsh is not None:
+            minhash = self._minhash(_normalize(paragraph))
+            if minhash is not None:
+                self._lsh.insert(key, minhash)
+
+    def _minhash(self, normalized: str):
+        if len(normalized) < _SHINGLE_SIZE:
+            return None
+        from datasketch import MinHash
+
+        minhash = MinHash(num_perm=self._num_perm)
+        for start in range(len(normalized) - _SHINGLE_SIZE + 1):
+            minhash.update(normalized[start : start + _SHINGLE_SIZE].encode("utf-8"))
+        return minhash
+
+
+def _normalize(paragraph: str) -> str:
+    normalized = _WHITESPACE_RE.sub(" ", _PUNCTUATION_RE.sub("", paragraph.lower())).strip()
+    # Paragraphs made only of punctuation keep their own identity.
+    return normalized or paragraph.strip()
+
+
+__all__ = ["TranslationMemory"]
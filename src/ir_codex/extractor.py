@@ -3,10 +3,15 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import deque
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Tuple
 
-from pypdf import PdfReader
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover - pypdf remains available as a fallback
+    pymupdf = None
+    from pypdf import PdfReader
 
 from .cleaner import clean_text
 from .config import SOURCE_PDF
@@ -15,32 +20,27 @@ from .utils import ChapterRecord, slugify
 logger = logging.getLogger(__name__)
 
 _TITLE_PATTERN = re.compile(r"^[A-Z][A-Za-z0-9 ,\-\'\(\)/:&]+$")
+_PAGE_NOISE_RE = re.compile(r"Page \d+", re.IGNORECASE)
+_FOLIO_RE = re.compile(r"\d+|[ivxlcdm]+")
+_LINE_SEPARATOR_TRANSLATION = str.maketrans({"\u2028": " ", "\u2029": " "})
+# Pages with less text than this that carry images are treated as scans.
+_MIN_PAGE_TEXT_CHARS = 20
 
 
 def extract_chapters(pdf_path: str | Path = SOURCE_PDF) -> List[ChapterRecord]:
     """Read the PDF and segment its contents into numbered chapters."""
     logger.info("Extracting chapters from %s", pdf_path)
-    reader = PdfReader(str(pdf_path))
-    all_lines: list[str] = []
-    for page_number, page in enumerate(reader.pages, start=1):
-        page_text = page.extract_text() or ""
-        lines = [line.strip() for line in page_text.splitlines()]
-        lines = [_filter_noise(line) for line in lines]
-        lines = [line for line in lines if line is not None]
-        all_lines.extend(lines)
-        all_lines.append("")  # explicit page break to assist heuristics
-        logger.debug("Loaded %d lines from page %d", len(lines), page_number)
-
     chapters: list[ChapterRecord] = []
     current_lines: list[str] = []
     current_number: int | None = None
     current_title: str | None = None
+    skip_title = False
 
-    idx = 0
-    while idx < len(all_lines):
-        line = all_lines[idx].strip()
-        next_line = all_lines[idx + 1].strip() if idx + 1 < len(all_lines) else ""
-        prev_line = all_lines[idx - 1].strip() if idx > 0 else ""
+    for prev_line, line, next_line in _iter_windows(_iter_lines(pdf_path)):
+        if skip_title:
+            # The title line was already consumed together with its chapter number.
+            skip_title = False
+            continue
 
         if line.isdigit() and _looks_like_title(next_line) and not prev_line:
             number = int(line)
@@ -51,11 +51,10 @@ def extract_chapters(pdf_path: str | Path = SOURCE_PDF) -> List[ChapterRecord]:
             current_number = number
             current_title = title
             current_lines = []
-            idx += 2
+            skip_title = True
             continue
 
-        current_lines.append(all_lines[idx])
-        idx += 1
+        current_lines.append(line)
 
     if current_number is not None and current_title is not None:
         chapters.append(_build_record(current_number, current_title, current_lines))
@@ -67,10 +66,60 @@ def extract_chapters(pdf_path: str | Path = SOURCE_PDF) -> List[ChapterRecord]:
     return chapters
 
 
+def _iter_lines(pdf_path: str | Path) -> Iterator[str]:
+    """Yield the filtered lines of every page, followed by an empty page-break line."""
+    for page_number, page_text in enumerate(_iter_page_texts(pdf_path), start=1):
+        count = 0
+        at_page_top = True
+        for raw_line in page_text.splitlines():
+            line = _filter_noise(raw_line.strip())
+            if line is None:
+                continue
+            if at_page_top and line:
+                at_page_top = False
+                # A bare page number heading the page would otherwise pass for a chapter number.
+                if _FOLIO_RE.fullmatch(line):
+                    continue
+            count += 1
+            yield line
+        yield ""  # explicit page break to assist heuristics
+        logger.debug("Loaded %d lines from page %d", count, page_number)
+
+
+def _iter_windows(lines: Iterable[str]) -> Iterator[Tuple[str, str, str]]:
+    """Yield ``(prev, line, next)`` triples, padding both ends with empty lines."""
+    window: deque[str] = deque([""], maxlen=3)
+    for line in lines:
+        window.append(line)
+        if len(window) == 3:
+            yield window[0], window[1], window[2]
+    window.append("")
+    if len(window) == 3:
+        yield window[0], window[1], window[2]
+
+
+def _iter_page_texts(pdf_path: str | Path) -> Iterator[str]:
+    """Yield the raw text of each page, preferring PyMuPDF over pypdf."""
+    if pymupdf is not None:
+        with pymupdf.open(str(pdf_path)) as doc:
+            for page in doc:
+                # str.splitlines would break on these separators and invent empty lines.
+                text = (page.get_text("text") or "").translate(_LINE_SEPARATOR_TRANSLATION)
+                if len(text.strip()) < _MIN_PAGE_TEXT_CHARS and page.get_images():
+                    logger.info("Skipping page %d: image-only page without extractable text", page.number + 1)
+                    text = ""
+                yield text
+        return
+    logger.debug("PyMuPDF not available, falling back to pypdf")
+    reader = PdfReader(str(pdf_path))
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
 def _filter_noise(line: str) -> str | None:
     if not line:
         return ""
-    if re.fullmatch(r"Page \d+", line, flags=re.IGNORECASE):
+    if _PAGE_NOISE_RE.fullmatch(line):
         return None
     if line.strip().lower().startswith("international relations theory"):
         return None
@@ -78,18 +127,23 @@ def _filter_noise(line: str) -> str | None:
 
 
 def _looks_like_title(line: str) -> bool:
-    if not line:
-        return False
-    if len(line) > 80:
+    if not line or len(line) > 80:
         return False
     clean = line.strip()
-    if clean.lower().startswith("www"):
+    if not clean:
+        return False
+    first = clean[0]
+    # Most body lines start in lowercase, which already rules out both checks below.
+    if first.isalpha() and not first.isupper():
         return False
-    words = clean.split()
-    if not words:
+    if clean[:3].lower() == "www":
         return False
-    uppercase_like = all(word[0].isupper() for word in words if any(ch.isalpha() for ch in word))
-    return bool(_TITLE_PATTERN.match(clean)) or uppercase_like
+    if _TITLE_PATTERN.match(clean):
+        return True
+    for word in clean.split():
+        if not word[0].isupper() and any(ch.isalpha() for ch in word):
+            return False
+    return True
 
 
 def _build_record(number: int, title: str, lines: Iterable[str]) -> ChapterRecord:
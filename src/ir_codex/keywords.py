@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import logging
 import re
-from collections import Counter
+from collections import Counter, defaultdict
+from itertools import chain
 from typing import Iterable, List, Tuple
 
 from .translator import PortugueseTranslator
@@ -188,6 +189,7 @@ _STOPWORDS = {
 }
 
 _TOKEN_RE = re.compile(r"[^A-Za-z0-9']+")
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?\n]+")
 
 
 class KeywordGenerator:
@@ -213,8 +215,7 @@ class KeywordGenerator:
         if keywords:
             return keywords
         # Fallback to most common words if RAKE yields nothing
-        flat_words = [word for phrase in phrases for word in phrase]
-        counter = Counter(flat_words)
+        counter = Counter(chain.from_iterable(phrases))
         return [word for word, _ in counter.most_common(self.max_keywords)]
 
     def generate(self, english_text: str) -> List[Tuple[str, str]]:
@@ -230,17 +231,16 @@ class KeywordGenerator:
 
 
 def _extract_candidate_phrases(text: str) -> List[List[str]]:
-    sentences = re.split(r"[.!?\n]+", text)
+    stopwords = _STOPWORDS
+    split_tokens = _TOKEN_RE.split
     phrases: list[list[str]] = []
-    for sentence in sentences:
-        words = [
-            word.lower()
-            for word in _TOKEN_RE.split(sentence)
-            if word and not word.isdigit()
-        ]
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
         phrase: list[str] = []
-        for word in words:
-            if word in _STOPWORDS:
+        for token in split_tokens(sentence):
+            if not token or token.isdigit():
+                continue
+            word = token.lower()
+            if word in stopwords:
                 if phrase:
                     phrases.append(phrase)
                     phrase = []
@@ -252,24 +252,22 @@ def _extract_candidate_phrases(text: str) -> List[List[str]]:
 
 
 def _score_phrases(phrases: Iterable[List[str]]) -> dict[Tuple[str, ...], float]:
-    freq: Counter[str] = Counter()
-    degree: Counter[str] = Counter()
+    freq: defaultdict[str, int] = defaultdict(int)
+    degree: defaultdict[str, int] = defaultdict(int)
+    # Insertion-ordered set of phrases, so ties keep their first-seen order.
+    phrase_keys: dict[Tuple[str, ...], None] = {}
     for phrase in phrases:
-        unique_words = set(phrase)
-        phrase_length = len(phrase)
-        for word in phrase:
+        key = tuple(phrase)
+        phrase_keys[key] = None
+        phrase_length = len(key)
+        for word in key:
             freq[word] += 1
             degree[word] += phrase_length
-        for word in unique_words:
+        for word in set(key):
             degree[word] += phrase_length - 1
 
-    word_scores = {word: degree[word] / freq[word] for word in freq}
-
-    phrase_scores: dict[Tuple[str, ...], float] = {}
-    for phrase in phrases:
-        key = tuple(phrase)
-        phrase_scores[key] = sum(word_scores[word] for word in phrase)
-    return phrase_scores
+    word_scores = {word: degree[word] / count for word, count in freq.items()}
+    return {key: sum(word_scores[word] for word in key) for key in phrase_keys}
 
 
 __all__ = ["KeywordGenerator"]
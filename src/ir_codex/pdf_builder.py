@@ -2,68 +2,103 @@
 from __future__ import annotations
 
 import logging
+from io import BytesIO
 from pathlib import Path
-from typing import Sequence
+from typing import BinaryIO, Sequence
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
-from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, TableOfContents
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
 from .utils import ChapterRecord
 
 logger = logging.getLogger(__name__)
 
 
-def build_chapter_pdf(chapter: ChapterRecord, output_path: Path) -> None:
+def build_chapter_pdf(chapter: ChapterRecord, output_path: Path) -> int:
+    """Write the PDF for a single chapter and return its page count."""
     logger.info("Gerando PDF do capítulo %s", chapter.title)
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=A4,
-        leftMargin=25 * mm,
-        rightMargin=25 * mm,
-        topMargin=25 * mm,
-        bottomMargin=25 * mm,
-    )
     styles = _create_styles()
-    story = _chapter_story(chapter, styles)
-    doc.build(story, canvasmaker=NumberedCanvas)
+    return _build(_chapter_story(chapter, styles), str(output_path))
+
 
+def build_compiled_pdf(
+    chapters: Sequence[ChapterRecord],
+    output_path: Path,
+    page_counts: Sequence[int] | None = None,
+) -> None:
+    """Write the compiled PDF with a table of contents in a single layout pass.
 
-def build_compiled_pdf(chapters: Sequence[ChapterRecord], output_path: Path) -> None:
+    ``page_counts`` holds the page count of each chapter PDF, as returned by
+    :func:`build_chapter_pdf`; chapters are measured here when it is omitted.
+    """
     logger.info("Gerando PDF compilado em %s", output_path)
+    styles = _create_styles()
+    if page_counts is None:
+        page_counts = [_build(_chapter_story(chapter, styles), BytesIO()) for chapter in chapters]
+
+    # The contents pages shift every chapter, so lay them out until their length settles.
+    toc_pages = 1
+    while True:
+        measured = _build(_toc_story(chapters, page_counts, toc_pages, styles), BytesIO())
+        if measured == toc_pages:
+            break
+        toc_pages = measured
+
+    story = _toc_story(chapters, page_counts, toc_pages, styles)
+    for idx, chapter in enumerate(chapters):
+        story.extend(_chapter_story(chapter, styles))
+        if idx < len(chapters) - 1:
+            story.append(PageBreak())
+
+    _build(story, str(output_path))
+
+
+def _build(story: list, target: str | BinaryIO) -> int:
     doc = SimpleDocTemplate(
-        str(output_path),
+        target,
         pagesize=A4,
         leftMargin=25 * mm,
         rightMargin=25 * mm,
         topMargin=25 * mm,
         bottomMargin=25 * mm,
     )
-    styles = _create_styles()
-    toc = TableOfContents()
-    toc.levelStyles = [
-        ParagraphStyle(
-            name="TOCHeading",
-            parent=styles["BodyText"],
-            fontSize=11,
-            leading=14,
-            leftIndent=20,
-            firstLineIndent=-15,
-            spaceAfter=6,
-        )
-    ]
-
-    story = [Paragraph("Sumário", styles["CodexTitle"]), Spacer(1, 12), toc, PageBreak()]
-
-    for idx, chapter in enumerate(chapters):
-        story.extend(_chapter_story(chapter, styles))
-        if idx < len(chapters) - 1:
-            story.append(PageBreak())
-
     doc.build(story, canvasmaker=NumberedCanvas)
+    return doc.canv.page_count
+
+
+def _toc_story(
+    chapters: Sequence[ChapterRecord],
+    page_counts: Sequence[int],
+    toc_pages: int,
+    styles: dict[str, ParagraphStyle],
+) -> list:
+    rows = []
+    start_page = toc_pages + 1
+    for chapter, page_count in zip(chapters, page_counts):
+        rows.append([Paragraph(f"{chapter.number}. {chapter.title}", styles["TOCHeading"]), str(start_page)])
+        start_page += page_count
+
+    story: list = [Paragraph("Sumário", styles["CodexTitle"]), Spacer(1, 12)]
+    if rows:
+        table = Table(rows, colWidths=[None, 15 * mm])
+        table.setStyle(
+            TableStyle(
+                [
+                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+                    ("FONTSIZE", (1, 0), (1, -1), 11),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+                ]
+            )
+        )
+        story.append(table)
+    story.append(PageBreak())
+    return story
 
 
 def _chapter_story(chapter: ChapterRecord, styles: dict[str, ParagraphStyle]) -> list:
@@ -79,7 +114,6 @@ def _chapter_story(chapter: ChapterRecord, styles: dict[str, ParagraphStyle]) ->
         if not paragraph:
             continue
         story.append(Paragraph(paragraph.replace("\n", " "), styles["CodexBody"]))
-        story.append(Spacer(1, 10))
 
     return story
 
@@ -103,6 +137,8 @@ def _create_styles() -> dict[str, ParagraphStyle]:
             parent=styles["BodyText"],
             fontSize=11,
             leading=15,
+            # Paragraph gap as style spacing rather than a Spacer flowable per paragraph.
+            spaceAfter=16,
         )
     )
     styles.add(
@@ -115,19 +151,31 @@ def _create_styles() -> dict[str, ParagraphStyle]:
             textColor=colors.HexColor("#154360"),
         )
     )
+    styles.add(
+        ParagraphStyle(
+            name="TOCHeading",
+            parent=styles["BodyText"],
+            fontSize=11,
+            leading=14,
+            leftIndent=20,
+            firstLineIndent=-15,
+            spaceAfter=6,
+        )
+    )
     return styles
 
 
 class NumberedCanvas(canvas.Canvas):
-    """Canvas with page numbers and optional TOC integration."""
+    """Canvas with page numbers that records the final page count on save."""
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._saved_page_states: list[dict] = []
+        self.page_count = 0
 
     def showPage(self) -> None:  # pragma: no cover - reportlab handles runtime
         self._saved_page_states.append(dict(self.__dict__))
-        super().showPage()
+        self._startPage()
 
     def save(self) -> None:  # pragma: no cover - reportlab handles runtime
         total_pages = len(self._saved_page_states)
@@ -135,6 +183,7 @@ class NumberedCanvas(canvas.Canvas):
             self.__dict__.update(state)
             self._draw_page_number(total_pages)
             super().showPage()
+        self.page_count = total_pages
         super().save()
 
     def _draw_page_number(self, page_count: int) -> None:
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Sequence
 
 from .config import (
     CHAPTERS_DATA_PATH,
@@ -26,10 +29,9 @@ def run_extract(pdf_path: Path = SOURCE_PDF) -> list[ChapterRecord]:
     ensure_directories()
     chapters = extract_chapters(pdf_path)
     _cleanup_directory(EN_TEXT_DIR, suffix=".txt")
-    for chapter in chapters:
-        output_path = EN_TEXT_DIR / f"{chapter.number:02d}-{chapter.slug}.txt"
-        output_path.write_text(chapter.english_text, encoding="utf-8")
-        logger.debug("Saved raw chapter to %s", output_path)
+    _write_text_files(
+        [(EN_TEXT_DIR / f"{chapter.number:02d}-{chapter.slug}.txt", chapter.english_text) for chapter in chapters]
+    )
     save_chapter_records(chapters, CHAPTERS_DATA_PATH)
     logger.info("Extração concluída: %d capítulos", len(chapters))
     return chapters
@@ -40,12 +42,13 @@ def run_translate(translator: PortugueseTranslator | None = None) -> list[Chapte
     chapters = load_chapter_records(CHAPTERS_DATA_PATH)
     translator = translator or PortugueseTranslator()
     _cleanup_directory(PT_TEXT_DIR, suffix=".txt")
-    for chapter in chapters:
-        translated = translator.translate_text(chapter.english_text)
+    translations = translator.translate_texts([chapter.english_text for chapter in chapters])
+    files: list[tuple[Path, str]] = []
+    for chapter, translated in zip(chapters, translations):
         chapter.portuguese_text = translated
-        output_path = PT_TEXT_DIR / f"{chapter.number:02d}-{chapter.slug}.txt"
-        output_path.write_text(translated, encoding="utf-8")
+        files.append((PT_TEXT_DIR / f"{chapter.number:02d}-{chapter.slug}.txt", translated))
         logger.debug("Translated chapter %s", chapter.title)
+    _write_text_files(files)
     save_chapter_records(chapters, CHAPTERS_DATA_PATH)
     logger.info("Tradução concluída para %d capítulos", len(chapters))
     return chapters
@@ -56,6 +59,7 @@ def run_keywords(translator: PortugueseTranslator | None = None) -> list[Chapter
     chapters = load_chapter_records(CHAPTERS_DATA_PATH)
     translator = translator or PortugueseTranslator()
     generator = KeywordGenerator(translator)
+    files: list[tuple[Path, str]] = []
     for chapter in chapters:
         if not chapter.portuguese_text:
             raise RuntimeError(
@@ -68,15 +72,21 @@ def run_keywords(translator: PortugueseTranslator | None = None) -> list[Chapter
             keyword_line = "Palavras-chave: " + "; ".join(f"{pt} ({en})" for pt, en in keywords)
             text = f"{text}\n\n{keyword_line}" if text else keyword_line
         chapter.portuguese_text = text
-        output_path = PT_TEXT_DIR / f"{chapter.number:02d}-{chapter.slug}.txt"
-        output_path.write_text(text, encoding="utf-8")
+        files.append((PT_TEXT_DIR / f"{chapter.number:02d}-{chapter.slug}.txt", text))
         logger.debug("Keywords criadas para %s", chapter.title)
+    _write_text_files(files)
     save_chapter_records(chapters, CHAPTERS_DATA_PATH)
     logger.info("Palavras-chave geradas para %d capítulos", len(chapters))
     return chapters
 
 
-def run_pdf() -> None:
+def run_pdf(jobs: int | None = None) -> None:
+    """Build the chapter PDFs in ``jobs`` worker processes, then the compiled PDF.
+
+    ``jobs`` defaults to one process per CPU; ``jobs=1`` builds every chapter in
+    the current process.
+    """
+    _check_jobs(jobs)
     ensure_directories()
     chapters = load_chapter_records(CHAPTERS_DATA_PATH)
     missing = [chapter.title for chapter in chapters if not chapter.portuguese_text]
@@ -86,30 +96,54 @@ def run_pdf() -> None:
         )
     _cleanup_directory(CHAPTER_PDF_DIR, suffix=".pdf")
     CHAPTER_PDF_DIR.mkdir(parents=True, exist_ok=True)
-    for chapter in chapters:
-        pdf_path = CHAPTER_PDF_DIR / f"{chapter.number:02d}-{chapter.slug}.pdf"
-        build_chapter_pdf(chapter, pdf_path)
+    pdf_paths = [CHAPTER_PDF_DIR / f"{chapter.number:02d}-{chapter.slug}.pdf" for chapter in chapters]
+    if jobs == 1:
+        page_counts = [build_chapter_pdf(chapter, pdf_path) for chapter, pdf_path in zip(chapters, pdf_paths)]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            page_counts = list(executor.map(build_chapter_pdf, chapters, pdf_paths))
     COMPILED_PDF_PATH.parent.mkdir(parents=True, exist_ok=True)
-    build_compiled_pdf(chapters, COMPILED_PDF_PATH)
+    # Chapter page counts let the compiled PDF number its contents without a second layout pass.
+    build_compiled_pdf(chapters, COMPILED_PDF_PATH, page_counts=page_counts)
     logger.info("PDFs gerados em %s", CHAPTER_PDF_DIR)
 
 
-def run_all() -> None:
+def run_all(jobs: int | None = None) -> None:
+    _check_jobs(jobs)
     ensure_directories()
     run_extract()
     translator = PortugueseTranslator()
     run_translate(translator=translator)
     run_keywords(translator=translator)
-    run_pdf()
+    run_pdf(jobs=jobs)
     logger.info("Pipeline completo concluído.")
 
 
+def _check_jobs(jobs: int | None) -> None:
+    # Validate before any output is cleaned up or expensive step is started.
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"O número de processos deve ser pelo menos 1: {jobs}")
+
+
+def _write_text_files(files: Sequence[tuple[Path, str]]) -> None:
+    """Write UTF-8 text files concurrently; file I/O releases the GIL."""
+    def write(item: tuple[Path, str]) -> None:
+        path, content = item
+        path.write_text(content, encoding="utf-8")
+        logger.debug("Saved %s", path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Consume the results so that write errors propagate here.
+        list(executor.map(write, files))
+
+
 def _cleanup_directory(directory: Path, suffix: str) -> None:
     if not directory.exists():
         return
-    for item in directory.iterdir():
-        if item.is_file() and item.name.endswith(suffix):
-            item.unlink()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(suffix):
+                os.unlink(entry.path)
 
 
 __all__ = ["run_all", "run_extract", "run_keywords", "run_pdf", "run_translate"]
@@ -1,12 +1,18 @@
 """Translation helpers powered by Hugging Face transformers."""
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import Iterable, List, Sequence
 
+from .dedup import TranslationMemory
+
 logger = logging.getLogger(__name__)
 
+_CHUNK_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_WS_RE = re.compile(r"\s+")
+
 
 def _resolve_device() -> int:
     try:
@@ -19,45 +25,119 @@ def _resolve_device() -> int:
     return -1
 
 
+@functools.lru_cache(maxsize=4)
+def _load_pipeline(model_name: str, device: int, quantize: bool = False):
+    """Load a translation pipeline, shared process-wide per model, device and precision."""
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+
+    logger.info("Loading translation model %s", model_name)
+    if not quantize:
+        return pipeline("translation", model=model_name, device=device)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    if device < 0:
+        import torch
+
+        logger.info("Applying dynamic INT8 quantization to %s", model_name)
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    else:
+        # Dynamic INT8 kernels only exist on CPU; half precision is the GPU counterpart.
+        logger.info("Loading %s in half precision", model_name)
+        model = model.half()
+    return pipeline("translation", model=model, tokenizer=tokenizer, device=device)
+
+
 class PortugueseTranslator:
-    """Translate English prose and keywords into European Portuguese."""
+    """Translate English prose and keywords into European Portuguese.
+
+    The underlying Hugging Face pipeline is cached process-wide, so translators
+    created with the same model and device share a single loaded model. With
+    ``quantize=True`` the model runs with INT8 weights on CPU and in half
+    precision on GPU. Paragraph translations are remembered per instance so
+    repeated paragraphs are translated once; ``near_duplicate_threshold`` extends
+    this to near-duplicates (see :class:`~ir_codex.dedup.TranslationMemory`).
+    """
 
     def __init__(
         self,
         model_name: str = "Helsinki-NLP/opus-mt-en-pt",
         device: int | None = None,
         max_chunk_chars: int = 400,
+        batch_size: int = 32,
+        quantize: bool = False,
+        near_duplicate_threshold: float | None = None,
     ) -> None:
         self.model_name = model_name
         self.device = _resolve_device() if device is None else device
         self.max_chunk_chars = max_chunk_chars
+        self.batch_size = batch_size
+        self.quantize = quantize
+        self._memory = TranslationMemory(near_duplicate_threshold)
         self._pipeline = None
 
     def _get_pipeline(self):
         if self._pipeline is None:
-            from transformers import pipeline
-
-            logger.info("Loading translation model %s", self.model_name)
-            self._pipeline = pipeline("translation", model=self.model_name, device=self.device)
+            self._pipeline = _load_pipeline(self.model_name, self.device, self.quantize)
         return self._pipeline
 
     def translate_paragraph(self, text: str) -> str:
-        translator = self._get_pipeline()
-        text = text.strip()
-        if not text:
-            return ""
-        chunks = list(_chunk_text(text, self.max_chunk_chars))
-        logger.debug("Translating paragraph in %d chunks", len(chunks))
-        results = translator(chunks, max_length=512)
-        translated = " ".join(item["translation_text"].strip() for item in results)
-        return _normalize_spacing(translated)
+        """Translate a single paragraph; see :meth:`translate_texts`."""
+        return self.translate_texts([text])[0]
 
     def translate_text(self, text: str) -> str:
-        paragraphs = text.split("\n\n")
-        translated_paragraphs: list[str] = []
-        for paragraph in paragraphs:
-            translated_paragraphs.append(self.translate_paragraph(paragraph))
-        return "\n\n".join(part for part in translated_paragraphs).strip()
+        """Translate every paragraph of ``text`` in a single batched pipeline call."""
+        return self.translate_texts([text])[0]
+
+    def translate_texts(self, texts: Sequence[str]) -> List[str]:
+        """Translate several texts at once, batching the chunks of all their paragraphs.
+
+        Paragraphs already known to the translation memory are not sent to the
+        model again, and repeated paragraphs within ``texts`` are translated once.
+        """
+        paragraphs_per_text = [text.split("\n\n") for text in texts]
+        translated: list[list[str]] = [["" for _ in paragraphs] for paragraphs in paragraphs_per_text]
+        # Paragraph key -> (first occurrence, slots waiting for its translation)
+        pending: dict[int, tuple[str, list[tuple[int, int]]]] = {}
+        chunks: list[str] = []
+        owners: list[int] = []
+        reused = 0
+        for text_index, paragraphs in enumerate(paragraphs_per_text):
+            for paragraph_index, paragraph in enumerate(paragraphs):
+                paragraph = paragraph.strip()
+                if not paragraph:
+                    continue
+                cached = self._memory.get(paragraph)
+                if cached is not None:
+                    translated[text_index][paragraph_index] = cached
+                    reused += 1
+                    continue
+                key = self._memory.key(paragraph)
+                if key in pending:
+                    reused += 1
+                else:
+                    pending[key] = (paragraph, [])
+                    for chunk in _chunk_text(paragraph, self.max_chunk_chars):
+                        chunks.append(chunk)
+                        owners.append(key)
+                pending[key][1].append((text_index, paragraph_index))
+
+        if reused:
+            logger.debug("Reusing translations for %d repeated paragraphs", reused)
+        if chunks:
+            translator = self._get_pipeline()
+            logger.debug("Translating %d texts in %d chunks", len(texts), len(chunks))
+            results = translator(chunks, max_length=512, batch_size=self.batch_size)
+            pieces: dict[int, list[str]] = {key: [] for key in pending}
+            for key, item in zip(owners, results):
+                pieces[key].append(item["translation_text"].strip())
+            for key, (paragraph, slots) in pending.items():
+                translation = _normalize_spacing(" ".join(pieces[key]))
+                self._memory.add(paragraph, translation)
+                for text_index, paragraph_index in slots:
+                    translated[text_index][paragraph_index] = translation
+
+        return ["\n\n".join(parts).strip() for parts in translated]
 
     def translate_keywords(self, keywords: Sequence[str]) -> List[str]:
         translator = self._get_pipeline()
@@ -65,12 +145,12 @@ class PortugueseTranslator:
         if not cleaned:
             return []
         logger.debug("Translating %d keywords", len(cleaned))
-        results = translator(cleaned, max_length=128)
+        results = translator(cleaned, max_length=128, batch_size=self.batch_size)
         return [_normalize_spacing(item["translation_text"]) for item in results]
 
 
 def _chunk_text(text: str, max_chars: int) -> Iterable[str]:
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = _CHUNK_SPLIT_RE.split(text)
     chunk = ""
     for sentence in sentences:
         if not sentence:
@@ -86,7 +166,7 @@ def _chunk_text(text: str, max_chars: int) -> Iterable[str]:
 
 
 def _normalize_spacing(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
 
 
 __all__ = ["PortugueseTranslator"]
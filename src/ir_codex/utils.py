@@ -1,6 +1,7 @@
 """Utility helpers for the International Relations Codex pipeline."""
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
@@ -8,17 +9,26 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import List, Sequence
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the stdlib json module is used instead
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
 _SLUG_CLEAN_RE = re.compile(r"[^a-z0-9-]+")
+_PUNCT_RE = re.compile(r"['\"]")
+_SEP_RE = re.compile(r"[\s_/]+")
+_KEYWORDS_SECTION_RE = re.compile(r"\n\nPalavras-chave:.*\Z", re.S)
 
 
+@functools.lru_cache(maxsize=512)
 def slugify(value: str) -> str:
     """Create a filesystem-friendly slug from a title."""
     value = value.lower().strip()
-    value = re.sub(r"['\"]", "", value)
-    value = re.sub(r"[\s_/]+", "-", value)
+    value = _PUNCT_RE.sub("", value)
+    value = _SEP_RE.sub("-", value)
     value = _SLUG_CLEAN_RE.sub("", value)
     value = value.strip("-")
     return value or "capitulo"
@@ -61,19 +71,25 @@ def save_chapter_records(records: Sequence[ChapterRecord], path: Path) -> None:
     logger.debug("Saving chapter metadata to %s", path)
     path.parent.mkdir(parents=True, exist_ok=True)
     data = [record.to_dict() for record in records]
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
 def load_chapter_records(path: Path) -> list[ChapterRecord]:
     if not path.exists():
         raise FileNotFoundError(f"Metadata file not found: {path}")
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    if orjson is not None:
+        raw = orjson.loads(path.read_bytes())
+    else:
+        raw = json.loads(path.read_text(encoding="utf-8"))
     return [ChapterRecord.from_dict(item) for item in raw]
 
 
 def strip_keywords_section(text: str) -> str:
     """Remove an existing keywords section if present."""
-    return re.sub(r"\n\nPalavras-chave:.*\Z", "", text, flags=re.S)
+    return _KEYWORDS_SECTION_RE.sub("", text)
 
 
 __all__ = [